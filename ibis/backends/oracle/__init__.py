@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import contextlib
+import decimal
+import functools
 import re
+import time
 import warnings
 from functools import cached_property
-from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote_plus
 
 import oracledb
 import sqlglot as sg
 import sqlglot.expressions as sge
+from packaging.version import parse as vparse
 
 import ibis
 import ibis.backends.sql.compilers as sc
@@ -24,9 +27,9 @@ import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanListDatabase, PyArrowExampleLoader
 from ibis.backends.sql import SQLBackend
-from ibis.backends.sql.compilers.base import STAR, C
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
     from urllib.parse import ParseResult
 
     import pandas as pd
@@ -34,55 +37,217 @@ if TYPE_CHECKING:
     import pyarrow as pa
 
 
-def metadata_row_to_type(
-    *, type_mapper, type_string, precision, scale, nullable
-) -> dt.DataType:
-    """Convert a row from an Oracle metadata table to an Ibis type."""
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+
+# Oracle reports every integer column as some flavor of NUMBER, so the
+# nullable and non-nullable int64 types are by far the most common results of
+# metadata parsing; build them once and reuse them
+_INT64_T = (dt.Int64(nullable=False), dt.Int64(nullable=True))
+
+_OTHER, _INT, _DEC = range(3)
+
+
+@functools.lru_cache(maxsize=256)
+def _classify(type_string: str, precision: int | None, scale: int | None) -> int:
+    """Classify an Oracle metadata row as an integer, decimal or other type."""
     # See
     # https://docs.oracle.com/en/database/oracle/oracle-database/19/sqlrf/Data-Types.html#GUID-0BC16006-32F1-42B1-B45E-F27A494963FF
     # for details
-    #
-    # NUMBER(null, null) --> NUMBER(38) -> NUMBER(38, 0)
-    # (null, null) --> from_string()
-    if type_string == "NUMBER" and precision is None and not scale:
-        typ = dt.Int64(nullable=nullable)
-
-    # (null, 0) --> INT
-    # (null, 3), (null, 6), (null, 9) --> from_string() - TIMESTAMP(3)/(6)/(9)
-    elif precision is None and (scale is not None and scale == 0):
-        typ = dt.Int64(nullable=nullable)
-
-    # NUMBER(*, 0) --> INT
-    # (*, 0) --> from_string() - INTERVAL DAY(3) TO SECOND(0)
-    elif (
-        type_string == "NUMBER"
-        and precision is not None
-        and (scale is not None and scale == 0)
-    ):
-        typ = dt.Int64(nullable=nullable)
-
-    # NUMBER(*, > 0) --> DECIMAL
-    # (*, > 0) --> from_string() - INTERVAL DAY(3) TO SECOND(2)
-    elif (
-        type_string == "NUMBER"
-        and precision is not None
-        and (scale is not None and scale > 0)
-    ):
-        typ = dt.Decimal(precision=precision, scale=scale, nullable=nullable)
+    is_number = type_string == "NUMBER"
+
+    if precision is None:
+        # NUMBER(null, null) --> NUMBER(38) -> NUMBER(38, 0)
+        # (null, null) --> from_string()
+        #
+        # (null, 0) --> INT
+        # (null, 3), (null, 6), (null, 9) --> from_string() - TIMESTAMP(3)/(6)/(9)
+        if (is_number and not scale) or scale == 0:
+            return _INT
+    elif is_number and scale is not None:
+        # NUMBER(*, 0) --> INT
+        # (*, 0) --> from_string() - INTERVAL DAY(3) TO SECOND(0)
+        if scale == 0:
+            return _INT
+        # NUMBER(*, > 0) --> DECIMAL
+        # (*, > 0) --> from_string() - INTERVAL DAY(3) TO SECOND(2)
+        if scale > 0:
+            return _DEC
+    return _OTHER
+
+
+@functools.lru_cache(maxsize=256)
+def _type_from_string(type_mapper, type_string: str, nullable: bool) -> dt.DataType:
+    return type_mapper.from_string(type_string, nullable=nullable)
+
+
+# TODO(gforsyth): followup -- this should probably be made a default
+# transform for quoting backends
+def _quote_identifiers(node: sge.Expression) -> sge.Expression:
+    if isinstance(node, sg.exp.Table):
+        return sg.table(node.name, quoted=True)
+    elif isinstance(node, sg.exp.Column):
+        return sg.column(col=node.name, quoted=True)
+    return node
+
+
+@functools.lru_cache(maxsize=128)
+def _column_defs(schema: sch.Schema) -> tuple[sge.ColumnDef, ...]:
+    # schemas are immutable, so tables with the same shape share the result
+    return tuple(schema.to_sqlglot("oracle"))
+
+
+def _schema_to_sqlglot(schema: sch.Schema) -> list[sge.ColumnDef]:
+    """Return the Oracle column definitions of `schema`.
+
+    The definitions are copied from a cache because sqlglot nodes are mutable
+    and are re-parented when added to a tree.
+    """
+    return [col.copy() for col in _column_defs(schema)]
+
+
+@functools.cache
+def _pyarrow_reads_oracledb_arrays() -> bool:
+    import pyarrow as pa
+
+    # oracledb's arrays are read through the arrow PyCapsule interface, which
+    # pyarrow supports from version 14 onwards
+    return vparse(pa.__version__) >= vparse("14")
+
+
+def _arrow_fetchable(schema: sch.Schema) -> bool:
+    """Whether results with `schema` can be fetched through arrow without loss.
+
+    oracledb converts numbers to decimals only process-wide, has no arrow
+    equivalent for intervals, LOBs, JSON or object types, and drops the time
+    zone of timestamps.
+    """
+    for dtype in schema.types:
+        if (
+            dtype.is_decimal()
+            or dtype.is_interval()
+            or dtype.is_binary()
+            or dtype.is_json()
+            or dtype.is_nested()
+            or dtype.is_unknown()
+            or (dtype.is_timestamp() and dtype.timezone is not None)
+        ):
+            return False
+    return True
+
+
+def _decimal_output_type_handler(schema: sch.Schema) -> Callable | None:
+    """Return a cursor output type handler that fetches decimal columns as decimals.
+
+    Only the columns of `schema` with a decimal type pay for constructing
+    `decimal.Decimal` objects; other numbers are fetched as `int` or `float`.
+    """
+    decimal_columns = frozenset(
+        name for name, dtype in schema.items() if dtype.is_decimal()
+    )
+    if not decimal_columns:
+        return None
+
+    def handler(cursor, metadata):
+        if (
+            metadata.name in decimal_columns
+            and metadata.type_code is oracledb.DB_TYPE_NUMBER
+        ):
+            return cursor.var(decimal.Decimal, arraysize=cursor.arraysize)
+        return None
 
-    else:
-        typ = type_mapper.from_string(type_string, nullable=nullable)
-    return typ
+    return handler
+
+
+def metadata_row_to_type(
+    *, type_mapper, type_string, precision, scale, nullable
+) -> dt.DataType:
+    """Convert a row from an Oracle metadata table to an Ibis type."""
+    nullable = bool(nullable)
+    kind = _classify(type_string, precision, scale)
+    if kind == _INT:
+        return _INT64_T[nullable]
+    elif kind == _DEC:
+        return dt.Decimal(precision=precision, scale=scale, nullable=nullable)
+    return _type_from_string(type_mapper, type_string, nullable)
 
 
 class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
     name = "oracle"
     compiler = sc.oracle.compiler
 
+    # the owner is passed as a bind variable so that the server can reuse the
+    # parsed statement across calls
+    #
+    # tables and views share a namespace within an owner, so there are no
+    # duplicates to remove
+    _LIST_TABLES_SQL = (
+        "SELECT table_name FROM all_tables WHERE owner = :owner "
+        "UNION ALL "
+        "SELECT view_name FROM all_views WHERE owner = :owner"
+    )
+
+    _LIST_DATABASES_SQL = "SELECT username FROM all_users ORDER BY username"
+
+    # databases correspond to users, other than that there's
+    # no notion of a database inside a catalog for oracle
+    _SESSION_IDENTITY_SQL = "SELECT global_name, USER FROM global_name"
+
+    _TABLE_COLUMNS_SQL = (
+        "SELECT column_name, data_type, data_precision, data_scale, nullable "
+        "FROM all_tab_columns "
+        "WHERE table_name = :name AND owner = :owner "
+        "ORDER BY column_id"
+    )
+
+    # create a view, open a cursor over its columns and drop the view in a
+    # single round trip; the ref cursor reads the catalog as of when it was
+    # opened, so it can still be fetched after the drop. The view is created
+    # unqualified, so it lives in the session's current schema, which differs
+    # from the user after `ALTER SESSION SET CURRENT_SCHEMA`
+    _DESCRIBE_VIEW_SQL = """
+BEGIN
+  EXECUTE IMMEDIATE :create_view;
+  BEGIN
+    OPEN :metadata FOR
+      SELECT column_name, data_type, data_precision, data_scale, nullable
+      FROM all_tab_columns
+      WHERE table_name = :name
+        AND owner = SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA')
+      ORDER BY column_id;
+  EXCEPTION
+    WHEN OTHERS THEN
+      -- drop the view no matter what
+      EXECUTE IMMEDIATE :drop_view;
+      RAISE;
+  END;
+  EXECUTE IMMEDIATE :drop_view;
+END;"""
+
+    class Options(ibis.config.Config):
+        """Oracle options.
+
+        Attributes
+        ----------
+        metadata_cache_ttl : float
+            Number of seconds to cache the results of `list_tables` and
+            `get_schema` for. Defaults to 0, which disables the cache.
+        metadata_connection : bool
+            Run catalog queries on a second connection with a statement cache,
+            so that repeated catalog queries are not parsed again. This opens
+            an additional database session. Has no effect on backends created
+            with `from_connection`.
+
+        """
+
+        metadata_cache_ttl: float = 0
+        metadata_connection: bool = False
+
+    # the optional second connection used for catalog queries
+    _metadata_con: oracledb.Connection | None = None
+
     @cached_property
     def version(self):
-        matched = re.search(r"(\d+)\.(\d+)\.(\d+)", self.con.version)
-        return ".".join(matched.groups())
+        return ".".join(_VERSION_RE.search(self.con.version).groups())
 
     def do_connect(
         self,
@@ -179,6 +344,12 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
         # https://python-oracledb.readthedocs.io/en/latest/user_guide/appendix_b.html#statement-caching-in-thin-and-thick-modes
         self.con = oracledb.connect(dsn, user=user, password=password, stmtcachesize=0)
 
+        # Catalog queries always bind the same types, so they can be run on a
+        # second, lazily opened connection that keeps its statement cache.
+        self._connect_metadata = functools.partial(
+            oracledb.connect, dsn, user=user, password=password, stmtcachesize=40
+        )
+
         self._post_connect()
 
     @util.experimental
@@ -194,6 +365,7 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
         new_backend = cls()
         new_backend._can_reconnect = False
         new_backend.con = con
+        new_backend._connect_metadata = None
         new_backend._post_connect()
         return new_backend
 
@@ -203,8 +375,50 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
         # I had to hack in the commit lines to the compiler
         # self.con.autocommit = True
 
-        # Set to ensure decimals come back as decimals
-        oracledb.defaults.fetch_decimals = True
+        self._metadata_cache: dict[tuple, tuple[float, Any]] = {}
+        self._session_identity: tuple[str, str] | None = None
+        self._close_metadata_con()
+
+        # names of the global temporary tables created by this backend, which
+        # must be truncated before they can be dropped
+        self._temp_tables: set[str] = set()
+
+    def _cached_metadata(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        """Return the result of `fetch`, reusing it for `metadata_cache_ttl` seconds."""
+        ttl = ibis.options.oracle.metadata_cache_ttl
+        if ttl <= 0:
+            return fetch()
+
+        now = time.monotonic()
+        cached = self._metadata_cache.get(key)
+        if cached is not None:
+            expires, value = cached
+            if now < expires:
+                return value
+
+        value = fetch()
+        self._metadata_cache[key] = now + ttl, value
+        return value
+
+    def clear_metadata_cache(self) -> None:
+        """Clear the client-side cache of table listings and schemas.
+
+        The cache is cleared whenever this backend creates or drops a table or
+        view, so this is only needed when `ibis.options.oracle.metadata_cache_ttl`
+        is set and tables have been changed outside of this backend instance.
+        """
+        self._metadata_cache.clear()
+
+    def _close_metadata_con(self) -> None:
+        if (con := self._metadata_con) is not None:
+            self._metadata_con = None
+            with contextlib.suppress(oracledb.Error):
+                con.close()
+
+    def disconnect(self) -> None:
+        """Close the connections to the database."""
+        self._close_metadata_con()
+        super().disconnect()
 
     def _from_url(self, url: ParseResult, **kwargs):
         self.do_connect(
@@ -217,18 +431,22 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
 
         return self
 
+    def _fetch_session_identity(self) -> tuple[str, str]:
+        """Return the current catalog and database, querying them only once."""
+        if (identity := self._session_identity) is None:
+            with self._safe_metadata_sql(self._SESSION_IDENTITY_SQL) as cur:
+                [identity] = cur.fetchall()
+            self._session_identity = identity
+        return identity
+
     @property
     def current_catalog(self) -> str:
-        with self._safe_raw_sql(sg.select(STAR).from_("global_name")) as cur:
-            [(catalog,)] = cur.fetchall()
+        catalog, _ = self._fetch_session_identity()
         return catalog
 
     @property
     def current_database(self) -> str:
-        # databases correspond to users, other than that there's
-        # no notion of a database inside a catalog for oracle
-        with self._safe_raw_sql(sg.select("user").from_("dual")) as cur:
-            [(database,)] = cur.fetchall()
+        _, database = self._fetch_session_identity()
         return database
 
     @contextlib.contextmanager
@@ -267,6 +485,47 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
             con.commit()
             return cursor
 
+    @contextlib.contextmanager
+    def _safe_metadata_sql(self, query: str, **kwargs: Any):
+        """Run a read-only catalog query, on the metadata connection if enabled."""
+        # existing connections passed to `from_connection` can't be
+        # duplicated, so catalog queries always share them
+        if (
+            not ibis.options.oracle.metadata_connection
+            or self._connect_metadata is None
+        ):
+            con = self.con
+        elif (con := self._metadata_con) is None:
+            con = self._metadata_con = self._connect_metadata()
+
+        with contextlib.closing(con.cursor()) as cursor:
+            # catalogs can be large, fetch them in as few round trips as possible
+            cursor.arraysize = 10_000
+            cursor.execute(query, **kwargs)
+            yield cursor
+
+    @contextlib.contextmanager
+    def _safe_query(self, query: str, schema: sch.Schema):
+        """Execute `query`, fetching its decimal columns as decimals."""
+        con = self.con
+        cursor = con.cursor()
+        # the default arraysize of 100 costs a round trip per 100 rows; it must
+        # be set before executing so the fetch buffers are sized accordingly
+        cursor.arraysize = 10_000
+        cursor.outputtypehandler = _decimal_output_type_handler(schema)
+
+        try:
+            cursor.execute(query)
+        except Exception:
+            con.rollback()
+            cursor.close()
+            raise
+        else:
+            con.commit()
+
+        with contextlib.closing(cursor):
+            yield cursor
+
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
     ) -> list[str]:
@@ -291,39 +550,25 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
             Database to list tables from. Default behavior is to show tables in
             the current database.
         """
-        if database is not None:
-            table_loc = database
+        # the owner is bound as a plain string, so build it from the names
+        # directly instead of rendering (and then unquoting) a sqlglot table
+        if database is None:
+            owner = self.con.username.upper()
+        elif isinstance(database, str) and "." not in database:
+            owner = database
         else:
-            table_loc = self.con.username.upper()
+            table_loc = self._to_sqlglot_table(database)
+            owner = table_loc.db
+            if catalog := table_loc.catalog:
+                owner = f"{catalog}.{owner}"
 
-        table_loc = self._to_sqlglot_table(table_loc)
+        def fetch():
+            with self._safe_metadata_sql(self._LIST_TABLES_SQL, owner=owner) as cur:
+                return cur.fetchall()
 
-        dialect = self.dialect
-
-        # Deeply frustrating here where if we call `convert` on `table_loc`,
-        # which is a sg.exp.Table, the quotes are rendered as double-quotes
-        # which are invalid. So, we unquote the database name here.
-        def unquote(node):
-            if isinstance(node, sg.exp.Identifier):
-                return sg.to_identifier(node.name, quoted=False)
-            return node
-
-        conditions = C.owner.eq(sge.convert(table_loc.transform(unquote).sql(dialect)))
-
-        tables = (
-            sg.select(C.table_name)
-            .from_("all_tables")
-            .distinct()
-            .where(conditions)
-            .union(
-                sg.select(C.view_name).from_("all_views").distinct().where(conditions)
-            )
-        )
+        out = self._cached_metadata(("list_tables", owner), fetch)
 
-        with self._safe_raw_sql(tables) as cur:
-            out = cur.fetchall()
-
-        return self._filter_with_like(map(itemgetter(0), out), like)
+        return self._filter_with_like((row[0] for row in out), like)
 
     def list_databases(
         self, *, like: str | None = None, catalog: str | None = None
@@ -333,10 +578,8 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
                 "No cross-catalog schema access in Oracle"
             )
 
-        query = sg.select("username").from_("all_users").order_by("username")
-
-        with self._safe_raw_sql(query) as con:
-            schemata = list(map(itemgetter(0), con))
+        with self._safe_metadata_sql(self._LIST_DATABASES_SQL) as cur:
+            schemata = [row[0] for row in cur.fetchall()]
 
         return self._filter_with_like(schemata, like)
 
@@ -345,23 +588,14 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
     ) -> sch.Schema:
         if database is None:
             database = self.con.username.upper()
-        stmt = (
-            sg.select(
-                C.column_name,
-                C.data_type,
-                C.data_precision,
-                C.data_scale,
-                C.nullable.eq(sge.convert("Y")).as_("nullable"),
-            )
-            .from_(sg.table("all_tab_columns"))
-            .where(
-                C.table_name.eq(sge.convert(name)),
-                C.owner.eq(sge.convert(database)),
-            )
-            .order_by(C.column_id)
-        )
-        with self._safe_raw_sql(stmt) as cur:
-            results = cur.fetchall()
+
+        def fetch():
+            with self._safe_metadata_sql(
+                self._TABLE_COLUMNS_SQL, name=name, owner=database
+            ) as cur:
+                return cur.fetchall()
+
+        results = self._cached_metadata(("get_schema", database, name), fetch)
 
         if not results:
             raise exc.TableNotFound(name)
@@ -373,7 +607,7 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
                 type_string=type_string,
                 precision=precision,
                 scale=scale,
-                nullable=nullable,
+                nullable=nullable == "Y",
             )
             for name, type_string, precision, scale, nullable in results
         }
@@ -447,7 +681,7 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
         initial_table = sg.table(temp_name, db=database, quoted=self.compiler.quoted)
         target = sge.Schema(
             this=initial_table,
-            expressions=(schema or table.schema()).to_sqlglot(self.dialect),
+            expressions=_schema_to_sqlglot(schema or table.schema()),
         )
 
         create_stmt = sge.Create(
@@ -471,6 +705,11 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
                     f"ALTER TABLE IF EXISTS {initial_table.sql(self.name)} RENAME TO {final_table.sql(self.name)}"
                 )
 
+        if temp:
+            self._temp_tables.add(name)
+
+        self.clear_metadata_cache()
+
         if schema is None:
             return self.table(name, database=database)
 
@@ -479,6 +718,26 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
             name, schema=schema, source=self, namespace=ops.Namespace(database=database)
         ).to_expr()
 
+    def create_view(
+        self,
+        name: str,
+        /,
+        obj: ir.Table,
+        *,
+        database: str | None = None,
+        overwrite: bool = False,
+    ) -> ir.Table:
+        # the view's schema is looked up right after it is created, so the
+        # cache has to be cleared first
+        self.clear_metadata_cache()
+        return super().create_view(name, obj, database=database, overwrite=overwrite)
+
+    def drop_view(
+        self, name: str, /, *, database: str | None = None, force: bool = False
+    ) -> None:
+        super().drop_view(name, database=database, force=force)
+        self.clear_metadata_cache()
+
     def drop_table(
         self,
         name: str,
@@ -492,17 +751,34 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
 
         table = sg.table(name, db=db, catalog=catalog, quoted=self.compiler.quoted)
 
-        with self.begin() as bind:
-            # global temporary tables cannot be dropped without first truncating them
-            #
-            # https://stackoverflow.com/questions/32423397/force-oracle-drop-global-temp-table
-            #
-            # ignore DatabaseError exceptions because the table may not exist
-            # because it's already been deleted
-            with contextlib.suppress(oracledb.DatabaseError):
-                bind.execute(f"TRUNCATE TABLE {table.sql(self.name)}")
+        def truncate():
+            with self.begin() as bind:
+                # global temporary tables cannot be dropped without first
+                # truncating them
+                #
+                # https://stackoverflow.com/questions/32423397/force-oracle-drop-global-temp-table
+                #
+                # ignore DatabaseError exceptions because the table may not exist
+                # because it's already been deleted
+                with contextlib.suppress(oracledb.DatabaseError):
+                    bind.execute(f"TRUNCATE TABLE {table.sql(self.name)}")
+
+        if name in self._temp_tables:
+            truncate()
 
-        super().drop_table(name, database=(catalog, db), force=force)
+        try:
+            super().drop_table(name, database=(catalog, db), force=force)
+        except oracledb.DatabaseError as e:
+            # ORA-14452: a global temporary table not created by this backend
+            # that holds rows in this session
+            [error] = e.args
+            if error.code != 14452:
+                raise
+            truncate()
+            super().drop_table(name, database=(catalog, db), force=force)
+
+        self._temp_tables.discard(name)
+        self.clear_metadata_cache()
 
     def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
         schema = op.schema
@@ -518,45 +794,55 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
             kind="TABLE",
             this=sg.exp.Schema(
                 this=sg.to_identifier(name, quoted=quoted),
-                expressions=schema.to_sqlglot(self.dialect),
+                expressions=_schema_to_sqlglot(schema),
             ),
             properties=sge.Properties(expressions=[sge.TemporaryProperty()]),
         ).sql(self.name)
 
-        data = op.data.to_frame().replace(float("nan"), None)
+        data = op.data.to_frame()
         insert_stmt = self._build_insert_template(
             name, schema=schema, placeholder=":{i:d}"
         )
+
         with self.begin() as cur:
             cur.execute(create_stmt)
-            for start, end in util.chunks(len(data), chunk_size=128):
+            self._temp_tables.add(name)
+            self.clear_metadata_cache()
+            for start, end in util.chunks(len(data), chunk_size=10_000):
+                # convert one chunk at a time to bound the number of Python
+                # objects alive at once; `tolist` converts to Python scalars,
+                # which oracledb can bind directly
+                columns = []
+                for _, values in data.iloc[start:end].items():
+                    # only float, object and datetime-like columns can contain
+                    # NaN or NaT, which must be inserted as NULL
+                    if values.dtype.kind in "fOmM":
+                        values = values.astype(object).where(values.notna(), None)
+                    columns.append(values.tolist())
+
+                # oracledb requires a list of rows here, not an arbitrary iterable
                 cur.executemany(
-                    insert_stmt, list(data.iloc[start:end].itertuples(index=False))
+                    insert_stmt,
+                    list(zip(*columns)),
+                    batcherrors=False,
+                    arraydmlrowcounts=False,
                 )
 
     def _get_schema_using_query(self, query: str) -> sch.Schema:
-        name = util.gen_name("oracle_metadata")
         dialect = self.name
 
         try:
-            sg_expr = sg.parse_one(query, into=sg.exp.Table, dialect=dialect)
+            table = sg.parse_one(query, into=sg.exp.Table, dialect=dialect)
         except sg.ParseError:
             sg_expr = sg.parse_one(query, dialect=dialect)
+        else:
+            # If query is a table, its schema can be read directly from the
+            # catalog without going through a view
+            return self.get_schema(table.name, database=table.db or None)
 
-        # If query is a table, adjust the query accordingly
-        if isinstance(sg_expr, sg.exp.Table):
-            sg_expr = sg.select(STAR).from_(sg_expr)
-
-        # TODO(gforsyth): followup -- this should probably be made a default
-        # transform for quoting backends
-        def transformer(node):
-            if isinstance(node, sg.exp.Table):
-                return sg.table(node.name, quoted=True)
-            elif isinstance(node, sg.exp.Column):
-                return sg.column(col=node.name, quoted=True)
-            return node
+        sg_expr = sg_expr.transform(_quote_identifiers)
 
-        sg_expr = sg_expr.transform(transformer)
+        name = util.gen_name("oracle_metadata")
 
         this = sg.table(name, quoted=True)
         create_view = sg.exp.Create(kind="VIEW", this=this, expression=sg_expr).sql(
@@ -564,27 +850,17 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
         )
         drop_view = sg.exp.Drop(kind="VIEW", this=this).sql(dialect)
 
-        metadata_query = (
-            sg.select(
-                C.column_name,
-                C.data_type,
-                C.data_precision,
-                C.data_scale,
-                C.nullable.eq(sge.convert("Y")),
-            )
-            .from_("all_tab_columns")
-            .where(C.table_name.eq(sge.convert(name)))
-            .order_by(C.column_id)
-            .sql(dialect)
-        )
-
         with self.begin() as con:
-            con.execute(create_view)
-            try:
-                results = con.execute(metadata_query).fetchall()
-            finally:
-                # drop the view no matter what
-                con.execute(drop_view)
+            metadata = con.var(oracledb.DB_TYPE_CURSOR)
+            con.execute(
+                self._DESCRIBE_VIEW_SQL,
+                create_view=create_view,
+                drop_view=drop_view,
+                metadata=metadata,
+                name=name,
+            )
+            with contextlib.closing(metadata.getvalue()) as cur:
+                results = cur.fetchall()
 
         schema = {}
 
@@ -596,12 +872,116 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
                 type_string=type_string,
                 precision=precision,
                 scale=scale,
-                nullable=nullable,
+                nullable=nullable == "Y",
             )
             schema[name] = typ
 
         return sch.Schema(schema)
 
+    def execute(
+        self,
+        expr: ir.Expr,
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame | pd.Series | Any:
+        """Execute an Ibis expression and return a pandas `DataFrame`, `Series`, or scalar.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to execute.
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            no limit. The default is in `ibis/config.py`.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        DataFrame | Series | scalar
+            The result of the expression execution.
+        """
+
+        self._run_pre_execute_hooks(expr)
+        table = expr.as_table()
+        sql = self.compile(table, limit=limit, params=params, **kwargs)
+
+        schema = table.schema()
+
+        # oracledb >= 3.0 can fetch results directly into arrow arrays
+        if (
+            hasattr(self.con, "fetch_df_all")
+            and _pyarrow_reads_oracledb_arrays()
+            and _arrow_fetchable(schema)
+        ):
+            try:
+                result = self._fetch_arrow(sql, schema)
+            except oracledb.NotSupportedError:
+                # a column type that `_arrow_fetchable` didn't rule out has no
+                # arrow equivalent; the query is run again below
+                pass
+            else:
+                if result is not None:
+                    return expr.__pandas_result__(result)
+
+        with self._safe_query(sql, schema) as cur:
+            result = self._fetch_from_cursor(cur, schema)
+        return expr.__pandas_result__(result)
+
+    def _cursor_batches(
+        self,
+        expr: ir.Expr,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        chunk_size: int = 1 << 20,
+    ) -> Iterable[list]:
+        self._run_pre_execute_hooks(expr)
+
+        with self._safe_query(
+            self.compile(expr, limit=limit, params=params), expr.as_table().schema()
+        ) as cursor:
+            while batch := cursor.fetchmany(chunk_size):
+                yield batch
+
+    def _fetch_arrow(self, sql: str, schema: sch.Schema) -> pd.DataFrame | None:
+        """Fetch the results of `sql` as arrow arrays.
+
+        Returns `None` if the integer results can't be represented exactly, in
+        which case the caller has to run the query again through a cursor.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        from ibis.backends.oracle.converter import OraclePandasData
+
+        con = self.con
+        try:
+            odf = con.fetch_df_all(sql, arraysize=10_000)
+        except Exception:
+            con.rollback()
+            raise
+
+        table = pa.Table.from_arrays(odf.column_arrays(), names=schema.names)
+
+        for name, dtype in schema.items():
+            column = table[name]
+            # NUMBER columns without a precision, such as the results of
+            # aggregations, are fetched as doubles, which represent integers
+            # exactly only up to 2 ** 53; larger values force the query to be
+            # run a second time, so for non-deterministic queries the result
+            # comes from that second run
+            if dtype.is_integer() and pa.types.is_floating(column.type):
+                largest = pc.max(pc.abs(column)).as_py()
+                if largest is not None and largest >= 2**53:
+                    return None
+
+        return OraclePandasData.convert_table(table.to_pandas(), schema)
+
     def _fetch_from_cursor(self, cursor, schema: sch.Schema) -> pd.DataFrame:
         # TODO(gforsyth): this can probably be generalized a bit and put into
         # the base backend (or a mixin)
@@ -609,7 +989,9 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
 
         from ibis.backends.oracle.converter import OraclePandasData
 
-        df = pd.DataFrame.from_records(cursor, columns=schema.names, coerce_float=True)
+        df = pd.DataFrame.from_records(
+            cursor.fetchall(), columns=schema.names, coerce_float=True
+        )
         return OraclePandasData.convert_table(df, schema)
 
     def _clean_up_tmp_table(self, name: str) -> None:
@@ -617,19 +999,31 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
 
         ident = sg.to_identifier(name, quoted=self.compiler.quoted)
 
-        truncate = sge.TruncateTable(expressions=[ident]).sql(dialect)
-        drop = sge.Drop(kind="TABLE", this=ident).sql(dialect)
-
+        statements = []
+        # global temporary tables cannot be dropped without first truncating them
+        #
+        # https://stackoverflow.com/questions/32423397/force-oracle-drop-global-temp-table
+        if name in self._temp_tables:
+            statements.append(sge.TruncateTable(expressions=[ident]).sql(dialect))
+        statements.append(sge.Drop(kind="TABLE", this=ident).sql(dialect))
+
+        # run both statements in a single round trip, ignoring errors because
+        # the table may not exist because it's already been deleted
+        block = "\n".join(
+            [
+                "BEGIN",
+                *(
+                    f"  BEGIN EXECUTE IMMEDIATE {sge.convert(stmt).sql(dialect)}; "
+                    "EXCEPTION WHEN OTHERS THEN NULL; END;"
+                    for stmt in statements
+                ),
+                "END;",
+            ]
+        )
         with self.begin() as bind:
-            # global temporary tables cannot be dropped without first truncating them
-            #
-            # https://stackoverflow.com/questions/32423397/force-oracle-drop-global-temp-table
-            #
-            # ignore DatabaseError exceptions because the table may not exist
-            # because it's already been deleted
-            with contextlib.suppress(oracledb.DatabaseError):
-                bind.execute(truncate)
-            with contextlib.suppress(oracledb.DatabaseError):
-                bind.execute(drop)
+            bind.execute(block)
+
+        self._temp_tables.discard(name)
+        self.clear_metadata_cache()
 
     _finalize_memtable = _drop_cached_table = _clean_up_tmp_table
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from datetime import date  # noqa: TC003
+from decimal import Decimal
+from types import SimpleNamespace
 
 import oracledb
 import pandas as pd
@@ -8,12 +10,14 @@ import pandas.testing as tm
 import pytest
 
 import ibis
+import ibis.backends.oracle as oracle_backend
 from ibis import udf
 from ibis.backends.oracle.tests.conftest import (
     ORACLE_HOST,
     ORACLE_PASS,
     ORACLE_USER,
 )
+from ibis.util import gen_name
 
 
 def test_ibis_is_not_defeated_by_statement_cache(con):
@@ -87,3 +91,151 @@ def test_invalid_port(con):
         match="DPY-6005: cannot connect to database",
     ):
         ibis.connect(url)
+
+
+def test_metadata_cache(con, monkeypatch):
+    now = 0.0
+    monkeypatch.setattr(oracle_backend, "time", SimpleNamespace(monotonic=lambda: now))
+    monkeypatch.setattr(ibis.options.oracle, "metadata_cache_ttl", 60)
+    con.clear_metadata_cache()
+
+    name = gen_name("oracle_metadata_cache")
+    assert name not in con.list_tables()
+
+    # create the table behind the backend's back, so only a new query can see it
+    with con.begin() as cur:
+        cur.execute(f'CREATE TABLE "{name}" ("a" NUMBER(18))')
+    try:
+        assert name not in con.list_tables()
+
+        now += 61
+        assert name in con.list_tables()
+    finally:
+        con.drop_table(name, force=True)
+
+    assert name not in con.list_tables()
+
+
+def test_metadata_cache_invalidated_by_views(con, monkeypatch):
+    monkeypatch.setattr(ibis.options.oracle, "metadata_cache_ttl", 60)
+    con.clear_metadata_cache()
+
+    name = gen_name("oracle_metadata_cache_view")
+    assert name not in con.list_tables()
+
+    con.create_view(name, con.table("functional_alltypes").select("id"))
+    try:
+        assert name in con.list_tables()
+    finally:
+        con.drop_view(name, force=True)
+
+    assert name not in con.list_tables()
+
+
+def test_decimals_are_fetched_without_global_defaults(con):
+    assert not oracledb.defaults.fetch_decimals
+
+    expr = ibis.literal(Decimal("1.25"), type="decimal(10, 2)").name("tmp")
+    result = con.execute(expr)
+    assert result == Decimal("1.25")
+    assert isinstance(result, Decimal)
+
+
+def test_memtable_nulls_round_trip(con):
+    df = pd.DataFrame(
+        {
+            "i": [0, 1],
+            "f": [1.5, None],
+            "s": ["a", None],
+            "t": pd.to_datetime(["2024-01-01 12:00:00", None]),
+        }
+    )
+
+    result = con.execute(ibis.memtable(df).order_by("i"))
+
+    assert result.f.iat[0] == 1.5
+    assert result.s.iat[0] == "a"
+    assert result.t.iat[0] == pd.Timestamp("2024-01-01 12:00:00")
+    assert result[["f", "s", "t"]].iloc[1].isna().all()
+
+
+def test_large_integer_results_are_exact(con):
+    value = 2**62 + 1
+    t = ibis.memtable({"a": [value, 1]})
+
+    assert con.execute(ibis.literal(value, type="int64").name("tmp")) == value
+    assert con.execute(t.a.max()) == value
+
+
+def test_sql_schema_from_query(con):
+    expr = con.sql(
+        """
+        SELECT "id", "double_col" * 2 AS "doubled", "string_col"
+        FROM "functional_alltypes"
+        WHERE "id" > 10
+        """
+    )
+    schema = expr.schema()
+
+    assert schema.names == ("id", "doubled", "string_col")
+    assert schema["id"].is_integer()
+    assert schema["doubled"].is_floating()
+    assert schema["string_col"].is_string()
+
+    # the temporary view used to describe the query is gone
+    assert not con.list_tables(like="^ibis_oracle_metadata_")
+
+
+def test_drop_untracked_global_temporary_table(con):
+    name = gen_name("oracle_untracked_gtt")
+    with con.begin() as cur:
+        cur.execute(
+            f'CREATE GLOBAL TEMPORARY TABLE "{name}" ("a" NUMBER(18)) '
+            "ON COMMIT PRESERVE ROWS"
+        )
+    with con.begin() as cur:
+        cur.execute(f'INSERT INTO "{name}" VALUES (1)')
+
+    con.drop_table(name)
+
+    assert name not in con.list_tables()
+
+
+def test_metadata_connection(monkeypatch):
+    monkeypatch.setattr(ibis.options.oracle, "metadata_connection", True)
+    new_con = ibis.oracle.connect(
+        user=ORACLE_USER,
+        password=ORACLE_PASS,
+        host=ORACLE_HOST,
+        database="IBIS_TESTING",
+    )
+    try:
+        assert "functional_alltypes" in new_con.list_tables()
+        new_con.reconnect()
+        assert new_con.get_schema("functional_alltypes").names
+    finally:
+        new_con.disconnect()
+
+
+def test_clean_up_tmp_tables(con):
+    tracked = gen_name("oracle_tmp_cleanup")
+    con.create_table(tracked, ibis.memtable({"a": [1, 2]}), temp=True)
+    already_dropped = gen_name("oracle_tmp_cleanup_dropped")
+
+    con._clean_up_tmp_table(tracked)
+    con._clean_up_tmp_table(already_dropped)
+
+    assert tracked not in con.list_tables()
+
+
+def test_metadata_cache_invalidated_by_cache_release(con, monkeypatch):
+    monkeypatch.setattr(ibis.options.oracle, "metadata_cache_ttl", 60)
+    con.clear_metadata_cache()
+
+    cached = con.table("functional_alltypes").select("id").cache()
+    name = cached.op().name
+    assert name in con.list_tables()
+
+    cached.release()
+
+    assert name not in con.list_tables()
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import pytest
+from pytest import param
+
 import ibis
+import ibis.expr.datatypes as dt
+from ibis.backends.oracle import _DEC, _INT, _OTHER, _classify, metadata_row_to_type
 
 
 def test_failed_column_inference(con):
@@ -21,3 +26,48 @@ def test_blob_raw(con):
     raw_blob = con.table("blob_raw_blobs_blob_raw")
 
     assert raw_blob.schema() == ibis.Schema(dict(blob="binary", raw="binary"))
+
+
+@pytest.mark.parametrize(
+    ("type_string", "precision", "scale", "expected"),
+    [
+        # NUMBER(null, null) --> NUMBER(38) -> NUMBER(38, 0)
+        param("NUMBER", None, None, _INT, id="number"),
+        # (null, 0) --> INT
+        param("NUMBER", None, 0, _INT, id="number-null-0"),
+        param("INTEGER", None, 0, _INT, id="integer-null-0"),
+        # (null, 3), (null, 6), (null, 9) --> TIMESTAMP(3)/(6)/(9)
+        param("TIMESTAMP(3)", None, 3, _OTHER, id="timestamp-3"),
+        param("TIMESTAMP(6)", None, 6, _OTHER, id="timestamp-6"),
+        param("TIMESTAMP(9)", None, 9, _OTHER, id="timestamp-9"),
+        param("NUMBER", None, 2, _OTHER, id="number-null-2"),
+        # NUMBER(*, 0) --> INT
+        param("NUMBER", 10, 0, _INT, id="number-10-0"),
+        # (*, 0) --> INTERVAL DAY(3) TO SECOND(0)
+        param("INTERVAL DAY(3) TO SECOND(0)", 3, 0, _OTHER, id="interval-0"),
+        # NUMBER(*, > 0) --> DECIMAL
+        param("NUMBER", 10, 2, _DEC, id="number-10-2"),
+        # (*, > 0) --> INTERVAL DAY(3) TO SECOND(2)
+        param("INTERVAL DAY(3) TO SECOND(2)", 3, 2, _OTHER, id="interval-2"),
+        param("NUMBER", 10, None, _OTHER, id="number-10-null"),
+        param("VARCHAR2(10)", None, None, _OTHER, id="varchar2"),
+    ],
+)
+def test_classify(type_string, precision, scale, expected):
+    assert _classify(type_string, precision, scale) == expected
+
+
+@pytest.mark.parametrize("nullable", [True, False])
+def test_metadata_row_to_type_numbers(nullable):
+    def metadata_row(precision, scale):
+        return metadata_row_to_type(
+            type_mapper=None,
+            type_string="NUMBER",
+            precision=precision,
+            scale=scale,
+            nullable=nullable,
+        )
+
+    assert metadata_row(None, None) == dt.Int64(nullable=nullable)
+    assert metadata_row(10, 0) == dt.Int64(nullable=nullable)
+    assert metadata_row(10, 2) == dt.Decimal(10, 2, nullable=nullable)